@@ -46,6 +46,7 @@ import os.path
 import pickle
 import datetime
 import warnings
+import threading
 import numpy as np
 import scipy.io as sio
 import cartopy.crs as ccrs
@@ -54,22 +55,37 @@ import matplotlib.dates as mdates
 import matplotlib.patches as patches
 
 from math import inf
-from glob import glob
+from operator import neg
+from os.path import isfile
+from itertools import repeat
 from natsort import os_sorted
+from collections import OrderedDict
+from functools import lru_cache
 from matplotlib.path import Path
 from numpy.typing import ArrayLike
 from abc import ABC, abstractmethod
-from os.path import basename, isfile
 from importlib.resources import files
 from scipy.stats import percentileofscore
+from bisect import bisect_left, bisect_right
 from typing import Union, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
 from matplotlib.figure import Figure as matFigure
 from moviepy.video.io.ImageSequenceClip import ImageSequenceClip
 
+try:
+    from numba import njit, prange
+except ImportError:
+    # numba is optional. Without it, kernels run as plain Python
+    prange = range
+
+    def njit(*args, **kwargs):
+        return lambda function: function
+
 POINT_TYPE = tuple[float, float]
 POINT_INDEX_TYPE = tuple[int, int]
 LIMIT_TYPE = tuple[float, float, float, float]
 TIME_TYPE = tuple[Optional[int], Optional[int], Optional[int], Optional[int]]
+TIME_STAMP_DTYPE = np.dtype([('year', np.int16), ('month', np.int8), ('day', np.int8), ('hour', np.int8)])
 DATA_TYPE = list[ArrayLike] | list[ArrayLike, ArrayLike]
 COMPONENT_TYPE = POINT_TYPE | ArrayLike | Path
 
@@ -93,6 +109,28 @@ class Variable:
     def __str__(self) -> str:
         return self.name
 
+    def get_combo_components(self, dataset: 'Dataset') -> tuple[str, 'Variable', 'Variable']:
+        """
+        The equation type and the two component variables of a combo variable, parsed from its equation.
+
+        The components are found in the given dataset, which must be the variable's dataset. They are parsed on first
+        use and then cached.
+        Args:
+            dataset: The variable's dataset.
+
+        Returns:
+            The equation type, and the first and second component variables.
+
+        """
+        if getattr(self, '_combo_cache', None) is None:
+            equation_type, x_identifier, y_identifier = self.equation.split('_')
+
+            x_variable = _get_variable_identifier(dataset, int(x_identifier))
+            y_variable = _get_variable_identifier(dataset, int(y_identifier))
+            self._combo_cache = equation_type, x_variable, y_variable
+
+        return self._combo_cache
+
     @classmethod
     def from_json(cls, data):
         """
@@ -139,20 +177,44 @@ class Dataset:
         return cls(data['directory'], data['name'], data['is_unified'], data['file_prefix'], data['file_suffix'],
                    variables)
 
+    def get_path_template(self) -> str:
+        """
+        The template for the filepaths of the dataset's data, for use with str.format.
+
+        The template has the fields root (the data directory from info.json), year and month (an integer, formatted
+        with two digits), and, if the dataset is not unified, identifier (the variable's file identifier). It is built
+        on first use and then cached.
+        Returns:
+            The template.
+
+        """
+        if getattr(self, '_path_template', None) is None:
+            template = f'{{root}}/{self.directory}/{{year}}/{self.file_prefix}'
+            if not self.is_unified:
+                template += '_{identifier}'
+            self._path_template = template + f'_m{{month:02d}}_y{{year}}_{self.file_suffix}.mat'
+
+        return self._path_template
+
 
 class Info:
     """
     Class storing all information for available data and tools, including file location, and a list of all datasets.
-    Includes visualisation methods such as projections and figure output modes.
+    Includes visualisation methods such as projections and figure output modes, the number of data files kept in
+    memory once loaded, and whether gathered data is reduced to half precision. Reduced precision is off by default.
+    Half precision turns magnitudes above 65504 into infinity, and keeps about three significant digits; so only use
+    it for variables within those limits.
     """
 
     def __init__(self, directory: str, projections: list[str], graph_styles: list[str], graph_out_modes: list[str],
-                 datasets: list[Dataset]) -> None:
+                 datasets: list[Dataset], load_cache_size: int = 4, reduced_precision: bool = False) -> None:
         self.directory = directory
         self.projections = projections
         self.graph_styles = graph_styles
         self.graph_out_modes = graph_out_modes
         self.datasets = datasets
+        self.load_cache_size = load_cache_size
+        self.reduced_precision = reduced_precision
 
     def __str__(self) -> str:
         return f'Info object of directory \'{self.directory}\''
@@ -169,7 +231,9 @@ class Info:
 
         """
         datasets = list(map(Dataset.from_json, data['datasets']))
-        return cls(data['directory'], data['projections'], data['graph_styles'], data['graph_out_modes'], datasets)
+        # Settings added after the original info.json format are optional, so that older edited copies still load
+        return cls(data['directory'], data['projections'], data['graph_styles'], data['graph_out_modes'], datasets,
+                   data.get('load_cache_size', 4), data.get('reduced_precision', False))
 
 
 class Graphable(ABC):
@@ -202,8 +266,8 @@ class PointCollection(Graphable):
         self.dataset = dataset
         self.variable = variable
         self.time = time
-        self.latitudes = latitudes
-        self.longitudes = longitudes
+        self.latitudes = np.asarray(latitudes, dtype=np.float64)
+        self.longitudes = np.asarray(longitudes, dtype=np.float64)
         self.title_prefix = title_prefix
         self.title_suffix = title_suffix
 
@@ -248,7 +312,7 @@ class PointCollection(Graphable):
             The limits.
 
         """
-        return min(self.latitudes), max(self.latitudes), min(self.longitudes), max(self.longitudes)
+        return np.min(self.latitudes), np.max(self.latitudes), np.min(self.longitudes), np.max(self.longitudes)
 
     def get_component(self, time_index) -> POINT_TYPE:
         """
@@ -317,12 +381,24 @@ class PathCollection(Graphable):
             The spatial limits.
 
         """
-        limits = list()
-        for path in self.paths:
-            ex = path.get_extents()
-            limits.append((ex.ymin, ex.ymax, ex.xmin, ex.xmax))
+        extents = self._get_extents()
+        return extents[:, 0].min(), extents[:, 1].max(), extents[:, 2].min(), extents[:, 3].max()
 
-        return _maximal_limits(tuple(limits))
+    def _get_extents(self) -> np.ndarray:
+        """
+        The limits of each path, as an array with one (lat_min, lat_max, lon_min, lon_max) row per time.
+
+        The extents are computed on first use and then cached. This is not done at initialization so that collections
+        pickled before the cache existed still work.
+        Returns:
+            The extents.
+
+        """
+        if getattr(self, '_extents', None) is None:
+            extents = [path.get_extents() for path in self.paths]
+            self._extents = np.array([(ex.ymin, ex.ymax, ex.xmin, ex.xmax) for ex in extents], dtype=np.float64)
+
+        return self._extents
 
     def contains_point(self, time_index: int, point: POINT_TYPE) -> bool:
         """
@@ -576,6 +652,9 @@ RADIUS_OF_EARTH = 6_371  # km
 loaded_data = None
 loaded_path = None
 loaded_dataset = None
+loaded_files = OrderedDict()
+loaded_lock = threading.Lock()  # guards the loaded variables, which combo components may change from two threads
+combo_thread_state = threading.local()
 function_calls = 0
 
 
@@ -635,26 +714,24 @@ def iterable_to_words(values: tuple) -> str:
         return words
 
 
-def _month_format(month: int) -> str:
+def _two_digit(digits: str) -> int:
     """
-    Formats a month number as a two-character-long string.
+    Parses a two-character-long string of digits as an integer. The digits are not validated.
 
-    Particularly useful for file path generation where months are represented with two characters.
+    Particularly useful for file name parsing where months are represented with two characters. Avoids the overhead
+    of int(), which matters when parsing many file names.
 
     Example:
-        The input 3 returns '03' while 12 returns '12'.
+        The input '03' returns 3 while '12' returns 12.
 
     Args:
-        month: The month.
+        digits: The digits.
 
     Returns:
-        The formatted string.
+        The integer.
 
     """
-    _function_call()
-
-    res = str(month)
-    return '0' + res if len(res) == 1 else res
+    return (ord(digits[0]) - 48) * 10 + ord(digits[1]) - 48
 
 
 def _time_suffix(time: TIME_TYPE) -> str:
@@ -724,6 +801,32 @@ def _time_stamps_to_filenames(time_stamps: tuple[TIME_TYPE, ...]) -> tuple[str]:
     return tuple(names)
 
 
+def time_stamps_to_array(time_stamps: tuple[TIME_TYPE, ...]) -> np.ndarray:
+    """
+    Converts a tuple of time stamps to a structured Numpy array, with fields year, month, day and hour.
+
+    Each record takes 5 bytes, against more than 100 for a tuple of four integers, and fields can be compared for all
+    time stamps at once. Indexing the array gives records which unpack like time stamp tuples.
+
+    Examples:
+        Time stamps in April of a data collection dc: time_stamps_to_array(dc.time_stamps)['month'] == 4
+
+    Args:
+        time_stamps: The time stamps.
+
+    Returns:
+        The array.
+
+    Raises:
+        ValueError: The time stamps must not contain None.
+
+    """
+    if any(piece is None for stamp in time_stamps for piece in stamp):
+        raise ValueError('The time stamps must not contain None.')
+
+    return np.array([tuple(stamp) for stamp in time_stamps], dtype=TIME_STAMP_DTYPE)
+
+
 def _coordinates_to_formatted(latitude: float, longitude: float) -> str:
     """
     Formats a point's coordinates to a string with degree symbol.
@@ -958,7 +1061,8 @@ def get_years(dataset: Dataset, variable: Optional[Variable] = None) -> list[int
     Returns a sorted list of years for which any data, or a specific variable, is available.
 
     If the variable is None, then years for which any data is available are included. Otherwise, only years which
-    have some data for the variable are included.
+    have some data for the variable are included. Results are cached until the dataset directory or one of its year
+    directories is modified. See invalidate_cache.
 
     Args:
         dataset: The dataset.
@@ -970,61 +1074,218 @@ def get_years(dataset: Dataset, variable: Optional[Variable] = None) -> list[int
     """
     _function_call()
 
-    years = list()
+    directory = f'{info.directory}/{dataset.directory}'
+    variable_identifier = None if variable is None else variable.identifier
+
+    # Files added to or removed from a year directory do not change the dataset directory's modification time, so the
+    # year directories' times are part of the key too
+    year_directories = _year_directories_cached(directory, _directory_time(directory))
+    modified_times = tuple(_directory_time(f'{directory}/{year}') for year in year_directories)
+
+    return list(_years_cached(directory, year_directories, modified_times, dataset.name, variable_identifier))
+
+
+def get_months(dataset: Dataset, year: int, variable: Optional[Variable] = None) -> list[int]:
+    """
+    Returns a sorted list of months for which any data, or a specific variable, is available.
+
+    If the variable is None, then months for which any data is available are included. Otherwise, only months which
+    have some data for the variable are included. Results are cached until the year directory is modified. See
+    invalidate_cache.
+
+    Args:
+        dataset: The dataset.
+        year: The year.
+        variable: The variable. Possibly None.
 
+    Returns:
+        The months.
+
+    """
+    _function_call()
+
+    directory = f'{info.directory}/{dataset.directory}/{year}'
+    variable_identifier = None if variable is None else variable.identifier
+
+    return list(_months_cached(directory, _directory_time(directory), dataset.name, year, variable_identifier))
+
+
+def invalidate_cache() -> None:
+    """
+    Clears all cached metadata, such as available years and months, and all cached data.
+
+    Only the available years and months are refreshed on their own, when a directory's modification time changes.
+    Everything cached for a file, such as its time information, coordinates and loaded data, is keyed by its path
+    alone. So this must be called by hand after a file is rewritten in place. It is also useful for testing and
+    debugging.
+
+    Returns:
+        None
+
+    """
+    global loaded_path, loaded_data, loaded_dataset
+
+    _year_directories_cached.cache_clear()
+    _years_cached.cache_clear()
+    _months_cached.cache_clear()
+    _load_time_information_path.cache_clear()
+    _time_index_table.cache_clear()
+    _day_hours_table.cache_clear()
+    _file_variable_cached.cache_clear()
+    _load_coordinates_path.cache_clear()
+    with loaded_lock:
+        loaded_files.clear()
+
+        loaded_data = None
+        loaded_path = None
+        loaded_dataset = None
+
+
+def _directory_time(directory: str) -> int:
+    """
+    The modification time of a directory in nanoseconds, or -1 if the directory does not exist.
+
+    Used as part of the key for cached directory scans, so that adding or removing files invalidates those scans.
+
+    Args:
+        directory: The directory.
+
+    Returns:
+        The modification time.
+
+    """
+    try:
+        return os.stat(directory).st_mtime_ns
+    except FileNotFoundError:
+        return -1
+
+
+def _scan_directory(directory: str) -> list[os.DirEntry]:
+    """
+    The visible entries of a directory, read in a single pass. Hidden files (starting with '.') are excluded, as they
+    are by glob. A missing directory has no entries.
+
+    Args:
+        directory: The directory.
+
+    Returns:
+        The entries.
+
+    """
+    try:
+        with os.scandir(directory) as it:
+            return [entry for entry in it if not entry.name.startswith('.')]
+    except FileNotFoundError:
+        return list()
+
+
+@lru_cache(maxsize=None)
+def _year_directories_cached(directory: str, modified_time: int) -> tuple[int, ...]:
+    """
+    The years of the year directories within a dataset directory, cached for get_years.
+
+    Args:
+        directory: The dataset directory.
+        modified_time: The modification time of the dataset directory. Only used as part of the cache key.
+
+    Returns:
+        The years.
+
+    """
     # Rely on organization within main dataset directory being in years
+    return tuple(int(entry.name) for entry in _scan_directory(directory))
+
+
+@lru_cache(maxsize=None)
+def _years_cached(directory: str, year_directories: tuple[int, ...], modified_times: tuple[int, ...],
+                  dataset_name: str, variable_identifier: Optional[int]) -> tuple[int, ...]:
+    """
+    Cached implementation of get_years. Takes hashable arguments in place of the Dataset and Variable objects.
+
+    Args:
+        directory: The dataset directory.
+        year_directories: The years of the year directories within the dataset directory.
+        modified_times: The modification times of the year directories. Only used as part of the cache key.
+        dataset_name: The name of the dataset.
+        variable_identifier: The identifier of the variable. Possibly None.
+
+    Returns:
+        The years.
+
+    """
+    dataset = get_dataset_name(dataset_name)
+    variable = None if variable_identifier is None else _get_variable_identifier(dataset, variable_identifier)
+
+    years = list()
+
     # Note, not all files in year directories have the correct prefix, so check for that too
 
-    for path in glob(f'{info.directory}/{dataset.directory}/*'):
-        # determine if valid year
-        test_year = int(basename(path))
+    for test_year in year_directories:
         if variable is None:
-            for sub_path in glob(f'{path}/*'):
-                if variable is None and basename(sub_path).startswith(dataset.file_prefix):
+            for sub_entry in _scan_directory(f'{directory}/{test_year}'):
+                if sub_entry.name.startswith(dataset.file_prefix):
                     years.append(test_year)
                     break
         else:
             if len(get_months(dataset, test_year, variable)) > 0:
                 years.append(test_year)
 
-    return sorted(years)
+    return tuple(sorted(years))
 
 
-def get_months(dataset: Dataset, year: int, variable: Optional[Variable] = None) -> list[int]:
+@lru_cache(maxsize=None)
+def _months_cached(directory: str, modified_time: int, dataset_name: str, year: int,
+                   variable_identifier: Optional[int]) -> tuple[int, ...]:
     """
-    Returns a sorted list of months for which any data, or a specific variable, is available.
-
-    If the variable is None, then months for which any data is available are included. Otherwise, only months which
-    have some data for the variable are included.
+    Cached implementation of get_months. Takes hashable arguments in place of the Dataset and Variable objects.
 
     Args:
-        dataset: The dataset.
+        directory: The year directory.
+        modified_time: The modification time of the year directory. Only used as part of the cache key.
+        dataset_name: The name of the dataset.
         year: The year.
-        variable: The variable. Possibly None.
+        variable_identifier: The identifier of the variable. Possibly None.
 
     Returns:
         The months.
 
     """
-    _function_call()
+    dataset = get_dataset_name(dataset_name)
+    variable = None if variable_identifier is None else _get_variable_identifier(dataset, variable_identifier)
 
-    months = list()
+    # Bit m of the mask is set once month m is found. Non-unified datasets have several files per month, and only the
+    # first of these needs checking
+    month_mask = 0
     # TODO add special case for non-unified datasets. Variable must available for a month to be included, unless the
     #  inputted variable is None
 
     # Access files within the given year's directory
     # Note, not all files in year directories have the correct prefix, so check for that too
-
-    for path in glob(f'{info.directory}/{dataset.directory}/{year}/*'):
-        sub_path = basename(path)
-        test_month = int(sub_path[sub_path.rindex('_') - 8:sub_path.rindex('_') - 6])  # relies heavily on formatting!
-        if sub_path.startswith(dataset.file_prefix) and (variable is None or isfile(_get_path(dataset, year,
-                                                                                              test_month, variable))):
-            months.append(test_month)
+    # File names end with _m{MM}_y{YYYY}_{suffix}.mat, so the month is at a fixed offset from the end
+    ending = f'_{dataset.file_suffix}.mat'
+    month_end = len(ending) + 6
+    month_start = month_end + 2
+
+    # Whether a variable's file exists is answered from the scan, rather than with a stat call for each candidate
+    file_names = {entry.name for entry in _scan_directory(directory) if entry.is_file()}
+
+    for sub_path in file_names:
+        if not (sub_path.startswith(dataset.file_prefix) and sub_path.endswith(ending)):
+            continue
+        # Files whose month is not two digits from 01 to 12 do not follow the formatting, and are skipped
+        month_digits = sub_path[-month_start:-month_end]  # relies heavily on formatting!
+        if not (len(month_digits) == 2 and month_digits.isascii() and month_digits.isdigit()):
+            continue
+        test_month = _two_digit(month_digits)
+        if not 1 <= test_month <= 12 or month_mask & (1 << test_month):
+            continue
+        # Paths from _get_path are within this directory, so the file name follows the directory and a separator
+        if variable is None or _get_path(dataset, year, test_month, variable)[len(directory) + 1:] in file_names:
+            month_mask |= 1 << test_month
 
     # TODO create information document on data assumptions and formatting
 
-    return sorted(list(set(months)))
+    return tuple(month for month in range(month_mask.bit_length()) if month_mask & (1 << month))
 
 
 def get_days(dataset: Dataset, year: int, month: int) -> list[int]:
@@ -1045,9 +1306,7 @@ def get_days(dataset: Dataset, year: int, month: int) -> list[int]:
     """
     _function_call()
 
-    data = _load(dataset, year, month, None)
-    # noinspection PyTypeChecker
-    return np.unique(data['day_ts']).tolist()
+    return list(_day_hours_table(_get_path(dataset, year, month, None)))
 
 
 def get_hours(dataset: Dataset, year: int, month: int, day: int) -> list[int]:
@@ -1055,7 +1314,7 @@ def get_hours(dataset: Dataset, year: int, month: int, day: int) -> list[int]:
     Returns a sorted list of hours available within a day.
 
     This function has no Variable parameter because the specified month already takes the variable of interest into
-    account.
+    account. Relies on the month's data being in chronological order. If the day is not available, the list is empty.
 
     Args:
         dataset: The dataset.
@@ -1067,15 +1326,54 @@ def get_hours(dataset: Dataset, year: int, month: int, day: int) -> list[int]:
         The hours.
 
     """
-    # Find indices of the given day and the associated hours
     _function_call()
 
-    data = _load(dataset, year, month, None)
-    days = data['day_ts']
-    hours = data['hour_ts']
-    hour_inds = np.asarray(days == day).nonzero()[0]
+    return list(_day_hours_table(_get_path(dataset, year, month, None)).get(day, ()))
+
 
-    return hours[hour_inds[0]:hour_inds[-1] + 1].tolist()
+@lru_cache(maxsize=None)
+def _day_hours_table(path: str) -> dict[int, tuple[int, ...]]:
+    """
+    Maps each day of a file's data, in ascending order, to its hours. Cached for each file, and cleared by
+    invalidate_cache, so that get_days and get_hours are lookups.
+
+    Relies on the file's data being in chronological order, as get_hours does.
+
+    Args:
+        path: The filepath.
+
+    Returns:
+        The table.
+
+    """
+    time_information = _load_time_information_path(path)
+    days = time_information['day_ts']
+    hours = time_information['hour_ts']
+
+    unique_days, starts = np.unique(days, return_index=True)
+    stops = np.searchsorted(days, unique_days, side='right')
+
+    return {day: tuple(hours[start:stop].tolist()) for day, start, stop in zip(unique_days.tolist(), starts.tolist(),
+                                                                                 stops.tolist())}
+
+
+def _get_day_bounds(dataset: Dataset, year: int, month: int, day: int) -> tuple[int, int]:
+    """
+    Returns the start and stop time indices of a day within a month's data, as for a slice. Relies on the month's data
+    being in chronological order. If the day is not available, start and stop are equal.
+
+    Args:
+        dataset: The dataset.
+        year: The year.
+        month: The month.
+        day: The day.
+
+    Returns:
+        The start and stop indices.
+
+    """
+    days = _load_time_information(dataset, year, month)['day_ts']
+    return int(np.searchsorted(days, day, side='left')), int(np.searchsorted(days, day, side='right'))
 
 
 def get_time_stamps(dataset: Dataset, variable: Variable, time: TIME_TYPE) -> tuple[TIME_TYPE, ...]:
@@ -1089,38 +1387,95 @@ def get_time_stamps(dataset: Dataset, variable: Variable, time: TIME_TYPE) -> tu
         The time stamps.
 
     """
-    time_stamps = list()
     range_year, range_month, range_day, range_hour = time
 
-    if (range_month is not None) and (range_year is None):
-        years = [x for x in get_years(dataset) if range_month in get_months(dataset, x, variable)]
-        for year in years:
-            for day in get_days(dataset, year, range_month):
-                for hour in get_hours(dataset, year, range_month, day):
-                    time_stamps.append((year, range_month, day, hour))
-    elif range_year is None:
-        for year in get_years(dataset, variable):
-            for month in get_months(dataset, year, variable):
-                for day in get_days(dataset, year, month):
-                    for hour in get_hours(dataset, year, month, day):
-                        time_stamps.append((year, month, day, hour))
-    elif range_month is None:
-        for month in get_months(dataset, range_year, variable):
-            for day in get_days(dataset, range_year, month):
-                for hour in get_hours(dataset, range_year, month, day):
-                    time_stamps.append((range_year, month, day, hour))
-    elif range_day is None:
-        for day in get_days(dataset, range_year, range_month):
-            for hour in get_hours(dataset, range_year, range_month, day):
-                time_stamps.append((range_year, range_month, day, hour))
-    elif range_hour is None:
-        for hour in get_hours(dataset, range_year, range_month, range_day):
-            time_stamps.append((range_year, range_month, range_day, hour))
+    if None not in time:
+        return time,
+
+    # Following the time convention, a day only narrows the period if the year and month are given
+    if range_year is None or range_month is None:
+        range_day = None
+
+    months = _get_time_months(dataset, variable, time)
+
+    def month_time_stamps(year_month: tuple[int, int]) -> list[TIME_TYPE]:
+        return _get_month_time_stamps(dataset, *year_month, range_day)
+
+    # Months are independent and loading their time information is I/O bound, so load them concurrently
+    if len(months) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(months), 2 * (os.cpu_count() or 1))) as executor:
+            month_stamps = list(executor.map(month_time_stamps, months))
     else:
-        time_stamps.append(time)
+        month_stamps = list(map(month_time_stamps, months))
+
+    time_stamps = list()
+    for stamps in month_stamps:
+        time_stamps.extend(stamps)
 
     return tuple(time_stamps)
 
+
+def _get_time_months(dataset: Dataset, variable: Variable, time: TIME_TYPE) -> list[tuple[int, int]]:
+    """
+    The (year, month) pairs, in order, for which a variable has data within a time.
+
+    This is the enumeration shared by get_time_stamps and _cut_interpret_data. If the time's year and month are both
+    given, that month is the only pair.
+
+    Args:
+        dataset: The dataset.
+        variable: The variable.
+        time: The time.
+
+    Returns:
+        The year and month pairs.
+
+    """
+    _function_call()
+
+    year, month, day, hour = time
+
+    if (year is None) and (month is not None):
+        return [(y, month) for y in get_years(dataset) if month in get_months(dataset, y, variable)]
+    elif year is None:
+        return [(y, m) for y in get_years(dataset, variable) for m in get_months(dataset, y, variable)]
+    elif month is None:
+        return [(year, m) for m in get_months(dataset, year, variable)]
+    else:
+        return [(year, month)]
+
+
+def _get_month_time_stamps(dataset: Dataset, year: int, month: int, day: Optional[int]) -> list[TIME_TYPE]:
+    """
+    Time stamps for every time index of a month's data, or only those of a given day.
+
+    The month's data is loaded once and the time stamps are built from its day and hour vectors directly, rather than
+    through get_days and get_hours. Days and hours are always ints.
+
+    Args:
+        dataset: The dataset.
+        year: The year.
+        month: The month.
+        day: The day. Possibly None.
+
+    Returns:
+        The time stamps.
+
+    """
+    _function_call()
+
+    data = _load_time_information(dataset, year, month)
+    days = data['day_ts']
+    hours = data['hour_ts']
+
+    if day is not None:
+        start, stop = _get_day_bounds(dataset, year, month, day)
+        return list(zip(repeat(year), repeat(month), repeat(day), hours[start:stop].astype(int).tolist()))
+
+    # Stored days and hours may be floats, but time stamps hold ints
+    return list(zip(repeat(year), repeat(month), days.astype(int).tolist(), hours.astype(int).tolist()))
+
+
 def is_available_names(dataset_name: str, variable_name: str, time: TIME_TYPE) -> bool:
     dataset = get_dataset_name(dataset_name)
     variable = get_variable_name(dataset, variable_name)
@@ -1164,23 +1519,48 @@ def _get_path(dataset: Dataset, year: Optional[int], month: Optional[int], varia
         year = get_years(dataset, variable)[0]
         month = get_months(dataset, year, variable)[0]
 
-    path = f'{info.directory}/{dataset.directory}/{year}/{dataset.file_prefix}'
+    identifier = None
 
     # Dataset is not unified
     if not dataset.is_unified:
         # Find arbitrary, non-combo, variable if none is provided
         if variable is None:
-            for v in dataset.variables:
-                if (not v.is_combo) and (isfile(_get_path(dataset, year, month, v))):
-                    variable = v
-                    break
+            variable_identifier = _file_variable_cached(info.directory, dataset.name, year, month)
+            variable = _get_variable_identifier(dataset, variable_identifier)
+
+        identifier = variable.file_identifier
 
-            if variable is None:
-                raise ValueError('No available non-combo variable found.')
+    return dataset.get_path_template().format(root=info.directory, year=year, month=month, identifier=identifier)
 
-        path += f'_{variable.file_identifier}'
 
-    return path + f'_m{_month_format(month)}_y{year}_{dataset.file_suffix}.mat'
+@lru_cache(maxsize=None)
+def _file_variable_cached(root: str, dataset_name: str, year: int, month: int) -> int:
+    """
+    Finds an arbitrary, non-combo variable with a file for a non-unified dataset, year and month, for _get_path.
+
+    Checking for files takes a system call for each variable tried, and _get_path finds its filepaths for every
+    metadata query, so the variable is cached. The cache is cleared by invalidate_cache.
+
+    Args:
+        root: The data directory. Only used as part of the cache key.
+        dataset_name: The name of the dataset.
+        year: The year.
+        month: The month.
+
+    Returns:
+        The identifier of the variable.
+
+    Raises:
+        ValueError: No available non-combo variable found.
+
+    """
+    dataset = get_dataset_name(dataset_name)
+
+    for variable in dataset.variables:
+        if (not variable.is_combo) and (isfile(_get_path(dataset, year, month, variable))):
+            return variable.identifier
+
+    raise ValueError('No available non-combo variable found.')
 
 
 def _load(dataset: Dataset, year: Optional[int], month: Optional[int], variable: Optional[Variable]) -> dict:
@@ -1190,7 +1570,8 @@ def _load(dataset: Dataset, year: Optional[int], month: Optional[int], variable:
     Desired data is specified with a dataset, date, time and variable. If no variable is provided and the dataset
     is not unified, one is chosen by the get_path function. A None variable should be used for when the used
     variable does not matter, for example to gather latitude and longitude information. Using this function
-    increases efficiency by ensuring that dats is not needlessly loaded.
+    increases efficiency by ensuring that dats is not needlessly loaded: the most recently used files, up to
+    info.load_cache_size, are kept in a least-recently-used cache.
 
     Args:
         dataset: The dataset.
@@ -1208,16 +1589,147 @@ def _load(dataset: Dataset, year: Optional[int], month: Optional[int], variable:
 
     global loaded_path, loaded_data, loaded_dataset
 
-    if (year is None) and (month is None) and (variable is None) and (dataset == loaded_dataset):
-        return loaded_data
+    with loaded_lock:
+        if (year is None) and (month is None) and (variable is None) and (dataset == loaded_dataset):
+            return loaded_data
 
     path = _get_path(dataset, year, month, variable)
-    if path != loaded_path:
-        loaded_data = sio.loadmat(path, squeeze_me=True)
+
+    with loaded_lock:
+        file_data = loaded_files.get(path)
+        if file_data is not None:
+            loaded_files.move_to_end(path)
+
+    # Read outside the lock, so that threads can read different files at once
+    if file_data is None:
+        file_data = sio.loadmat(path, squeeze_me=True)
+        # The file is shared through the cache, so its arrays are read-only. Changing them must fail, not corrupt it
+        for value in file_data.values():
+            if isinstance(value, np.ndarray):
+                value.setflags(write=False)
+
+    with loaded_lock:
+        if path not in loaded_files:
+            loaded_files[path] = file_data
+            if len(loaded_files) > info.load_cache_size:
+                loaded_files.popitem(last=False)
+
+        loaded_data = file_data
         loaded_path = path
         loaded_dataset = dataset
 
-    return loaded_data
+    return file_data
+
+
+def _load_time_information(dataset: Dataset, year: int, month: int) -> dict:
+    """
+    Loads only the time information (the day_ts and hour_ts vectors) of a month's data.
+
+    Unlike _load, the (possibly large) variable data is not read, and the result is cached for each file. This makes
+    metadata queries like get_days and get_hours cheap. The cache is cleared by invalidate_cache.
+
+    Args:
+        dataset: The dataset.
+        year: The year.
+        month: The month.
+
+    Returns:
+        The time information as a dictionary.
+
+    """
+    _function_call()
+
+    return _load_time_information_path(_get_path(dataset, year, month, None))
+
+
+@lru_cache(maxsize=None)
+def _load_time_information_path(path: str) -> dict:
+    """
+    Cached implementation of _load_time_information. The returned vectors are read-only, since they are shared.
+
+    Args:
+        path: The filepath.
+
+    Returns:
+        The time information as a dictionary.
+
+    """
+    data = sio.loadmat(path, squeeze_me=True, variable_names=('day_ts', 'hour_ts'))
+    time_information = dict()
+
+    for key in ('day_ts', 'hour_ts'):
+        vector = np.atleast_1d(data[key])
+        vector.setflags(write=False)
+        time_information[key] = vector
+
+    return time_information
+
+
+def _load_coordinates(dataset: Dataset) -> dict:
+    """
+    Loads only the coordinate information (the lat and lon vectors) of a dataset.
+
+    Like _load_time_information, the variable data is not read and the result is cached for each file, so repeated
+    grid queries share the same vectors. The cache is cleared by invalidate_cache. The dictionary also holds the
+    coordinates as lists, under lat_list and lon_list, for binary searches.
+
+    Args:
+        dataset: The dataset.
+
+    Returns:
+        The coordinate information as a dictionary.
+
+    """
+    _function_call()
+
+    return _load_coordinates_path(_get_path(dataset, None, None, None))
+
+
+@lru_cache(maxsize=None)
+def _load_coordinates_path(path: str) -> dict:
+    """
+    Cached implementation of _load_coordinates. The returned vectors are read-only, since they are shared.
+
+    Args:
+        path: The filepath.
+
+    Returns:
+        The coordinate information as a dictionary.
+
+    """
+    data = sio.loadmat(path, squeeze_me=True, variable_names=('lat', 'lon'))
+    coordinates = dict()
+
+    for key in ('lat', 'lon'):
+        vector = np.atleast_1d(data[key])
+        vector.setflags(write=False)
+        coordinates[key] = vector
+        coordinates[f'{key}_list'] = vector.tolist()
+
+    return coordinates
+
+
+def _get_index_limits(coordinates: list[float], minimum: float, maximum: float) -> tuple[int, int]:
+    """
+    Get the start and stop indices, as for a slice, of the coordinates within or equal to the bounds.
+
+    The coordinates must be sorted, either ascending or descending. If no coordinates are within the bounds,
+    start is at least stop.
+
+    Args:
+        coordinates: The coordinates.
+        minimum: The lower bound.
+        maximum: The upper bound.
+
+    Returns:
+        The start and stop indices.
+
+    """
+    if coordinates[0] > coordinates[-1]:
+        # Descending, as latitude usually is. Negated, the coordinates ascend, so search them in place without a copy
+        return bisect_left(coordinates, -maximum, key=neg), bisect_right(coordinates, -minimum, key=neg)
+
+    return bisect_left(coordinates, minimum), bisect_right(coordinates, maximum)
 
 
 def _get_time_index(dataset: Dataset, year: int, month: int, day: int, hour: int) -> int:
@@ -1237,23 +1749,44 @@ def _get_time_index(dataset: Dataset, year: int, month: int, day: int, hour: int
     Returns:
         The index.
 
+    Raises:
+        ValueError: No data for the day and hour.
+
     """
     _function_call()
 
-    data = _load(dataset, year, month, None)
+    try:
+        return _time_index_table(_get_path(dataset, year, month, None))[(day, hour)]
+    except KeyError:
+        raise ValueError(f'No data found for day {day} and hour {hour}') from None
 
-    days = data['day_ts']
-    hours = data['hour_ts']
 
-    hour_inds = np.asarray(days == day).nonzero()[0]
-    hours_sub = hours[hour_inds[0]:hour_inds[-1] + 1].tolist()
+@lru_cache(maxsize=None)
+def _time_index_table(path: str) -> dict[tuple[int, int], int]:
+    """
+    Maps each (day, hour) of a file's data to its time index. Cached for each file, and cleared by invalidate_cache.
+
+    Args:
+        path: The filepath.
+
+    Returns:
+        The table.
+
+    """
+    time_information = _load_time_information_path(path)
+    days = time_information['day_ts'].tolist()
+    hours = time_information['hour_ts'].tolist()
+
+    # If a day and hour repeat, the first index is kept, as a search would find it
+    table = dict()
+    for index, day_hour in enumerate(zip(days, hours)):
+        table.setdefault(day_hour, index)
 
-    return hour_inds[0] + hours_sub.index(hour)
+    return table
 
 
 def _get_coordinate_information(dataset: Dataset, limits: Optional[LIMIT_TYPE]) -> tuple[LIMIT_TYPE, ArrayLike,
 ArrayLike]:
-    # TODO efficiency could probably be improved, with the assumption that coordinates only increase
     """
     Get the coordinate indices corresponding to given coordinate limits, and coordinates cut to those limits.
 
@@ -1286,21 +1819,19 @@ ArrayLike]:
     """
     _function_call()
 
-    data = _load(dataset, None, None, None)
-
-    latitude = data['lat']
-    longitude = data['lon']
+    coordinates = _load_coordinates(dataset)
+    latitude = coordinates['lat']
+    longitude = coordinates['lon']
 
     if limits is None:
         return (0, len(latitude), 0, len(longitude)), latitude, longitude
 
-    lat_idx = np.asarray((latitude >= limits[0]) & (latitude <= limits[1])).nonzero()[0]
-    lon_idx = np.asarray((longitude >= limits[2]) & (longitude <= limits[3])).nonzero()[0]
+    coo_index = _get_index_limits(coordinates['lat_list'], limits[0], limits[1]) + \
+        _get_index_limits(coordinates['lon_list'], limits[2], limits[3])
 
-    if len(lat_idx) == 0 or len(lon_idx) == 0:
+    if coo_index[0] >= coo_index[1] or coo_index[2] >= coo_index[3]:
         raise IndexError('No data found for the given limits')
 
-    coo_index = lat_idx[0], lat_idx[-1] + 1, lon_idx[0], lon_idx[-1] + 1
     latitude = latitude[coo_index[0]:coo_index[1]]
     longitude = longitude[coo_index[2]:coo_index[3]]
 
@@ -1328,17 +1859,177 @@ ArrayLike]:
     Returns:
         The combo variable as a tuple of Numpy arrays, one for each resulting component.
 
+    Raises:
+        ValueError: Unknown combo equation type.
+        ValueError: The components must have the same shape.
+
     """
     _function_call()
 
-    if equation_type == 'component':
-        return [x, y]
-    elif equation_type == 'polar':
-        return [x * np.sin(np.deg2rad(y)), x * np.cos(np.deg2rad(y)), ]
-    elif equation_type == 'norm':
-        return [np.sqrt(np.square(x) + np.square(y)), ]
-    elif equation_type == 'direction':
-        return [np.rad2deg(np.arctan2(y, x)) - 90, ]  # TODO use oceanographic convention. This equation is wrong.
+    try:
+        equation = _COMBO_EQUATIONS[equation_type]
+    except KeyError:
+        raise ValueError(f'Unknown combo equation type: {equation_type}') from None
+
+    # Validated once here. The equations rely on it, and their compiled kernels do not check bounds
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if x.shape != y.shape:
+        raise ValueError(f'The components must have the same shape, not {x.shape} and {y.shape}.')
+
+    return equation(x, y)
+
+
+def _empty_equation_result(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    An empty array for the result of a combo equation, with the type NumPy would give for the equation.
+
+    Args:
+        x: The first component.
+        y: The second component.
+
+    Returns:
+        The array.
+
+    """
+    return np.empty(x.shape, dtype=np.result_type(x, y, np.float16))
+
+
+def _component_equation(x: np.ndarray, y: np.ndarray) -> list[np.ndarray, np.ndarray]:
+    """
+    The component combo equation: (x, y).
+
+    Args:
+        x: The first component.
+        y: The second component.
+
+    Returns:
+        The components, unchanged.
+
+    """
+    return [x, y]
+
+
+def _polar_equation(x: np.ndarray, y: np.ndarray) -> list[np.ndarray, np.ndarray]:
+    """
+    The polar combo equation: (x * sin(y), x * cos(y)), with y in degrees.
+
+    Args:
+        x: The first component.
+        y: The second component, in degrees.
+
+    Returns:
+        The two resulting components.
+
+    """
+    x_result = _empty_equation_result(x, y)
+    y_result = np.empty_like(x_result)
+    _polar_kernel(x, y, x_result, y_result)
+    return [x_result, y_result, ]
+
+
+def _norm_equation(x: np.ndarray, y: np.ndarray) -> list[np.ndarray]:
+    """
+    The norm combo equation: sqrt(x^2 + y^2).
+
+    Args:
+        x: The first component.
+        y: The second component.
+
+    Returns:
+        The norm, as the only resulting component.
+
+    """
+    result = _empty_equation_result(x, y)
+    _norm_kernel(x, y, result)
+    return [result, ]
+
+
+def _direction_equation(x: np.ndarray, y: np.ndarray) -> list[np.ndarray]:
+    """
+    The direction combo equation: arctan2(y, x) in degrees, minus 90.
+
+    Args:
+        x: The first component.
+        y: The second component.
+
+    Returns:
+        The direction in degrees, as the only resulting component.
+
+    """
+    result = _empty_equation_result(x, y)
+    _direction_kernel(x, y, result)
+    return [result, ]  # TODO use oceanographic convention. This equation is wrong.
+
+
+@njit(parallel=True, cache=True)
+def _polar_kernel(x: np.ndarray, y: np.ndarray, x_result: np.ndarray, y_result: np.ndarray) -> None:
+    """
+    Computes the polar combo equation into the result arrays. Compiled, and parallel over time, if numba is available.
+
+    Args:
+        x: The first component.
+        y: The second component, in degrees.
+        x_result: The first result component. Updated in place.
+        y_result: The second result component. Updated in place.
+
+    Returns:
+        None
+
+
+    """
+    for time_idx in prange(x.shape[0]):
+        # The second result holds the radians until the cosine replaces them, so no temporaries are needed
+        radians = y_result[time_idx]
+        np.deg2rad(y[time_idx], radians)
+        np.sin(radians, x_result[time_idx])
+        np.cos(radians, radians)
+        x_result[time_idx] *= x[time_idx]
+        y_result[time_idx] *= x[time_idx]
+
+
+@njit(parallel=True, cache=True)
+def _norm_kernel(x: np.ndarray, y: np.ndarray, result: np.ndarray) -> None:
+    """
+    Computes the norm combo equation into the result array. Compiled, and parallel over time, if numba is available.
+
+    Args:
+        x: The first component.
+        y: The second component.
+        result: The result. Updated in place.
+
+    Returns:
+        None
+
+
+    """
+    for time_idx in prange(x.shape[0]):
+        result[time_idx] = np.sqrt(np.square(x[time_idx]) + np.square(y[time_idx]))
+
+
+@njit(parallel=True, cache=True)
+def _direction_kernel(x: np.ndarray, y: np.ndarray, result: np.ndarray) -> None:
+    """
+    Computes the direction combo equation into the result array. Compiled, and parallel over time, if numba is
+    available.
+
+    Args:
+        x: The first component.
+        y: The second component.
+        result: The result. Updated in place.
+
+    Returns:
+        None
+
+
+    """
+    for time_idx in prange(x.shape[0]):
+        result[time_idx] = np.rad2deg(np.arctan2(y[time_idx], x[time_idx])) - 90
+
+
+# Combo equation type, as in the variable equation, to the function computing it
+_COMBO_EQUATIONS = {'component': _component_equation, 'polar': _polar_equation, 'norm': _norm_equation,
+                    'direction': _direction_equation}
 
 
 def _get_data(dataset: Dataset, variable: Variable, limits: Optional[LIMIT_TYPE], time: TIME_TYPE) -> DataCollection:
@@ -1372,8 +2063,8 @@ def _cut_interpret_data(dataset: Dataset, variable: Variable, coo_index: tuple[f
     Gathers data for a variable, dataset, time, and cut to coordinate limits.
 
     Performs any calculations coming from combo variables. Coordinate limit indices formatted as (lat_min, lat_max,
-    lon_min, lon_max). Data is always in a three-dimensional Numpy array, as required by the data collection object.
-    This function is separate from _get_data because it is recursively called for combo variable calculations.
+    lon_min, lon_max). Data is always in a three-dimensional, C-ordered Numpy array, as required by the data collection
+    object. Each time is then a contiguous plane, which the combo equations loop over. This function is separate from _get_data because it is recursively called for combo variable calculations.
 
 
     Args:
@@ -1389,13 +2080,23 @@ def _cut_interpret_data(dataset: Dataset, variable: Variable, coo_index: tuple[f
     _function_call()
 
     if variable.is_combo:
-        equation_type, x_identifier, y_identifier = variable.equation.split('_')
+        equation_type, x_variable, y_variable = variable.get_combo_components(dataset)
 
-        x_variable = _get_variable_identifier(dataset, int(x_identifier))
-        y_variable = _get_variable_identifier(dataset, int(y_identifier))
+        # The components of a non-unified dataset are in separate files, so they are read concurrently. Those of a
+        # unified dataset share a file, which is better read once. Nested combos stay on the current thread
+        if dataset.is_unified or getattr(combo_thread_state, 'is_component', False):
+            x = _cut_interpret_data(dataset, x_variable, coo_index, time)[0]
+            y = _cut_interpret_data(dataset, y_variable, coo_index, time)[0]
+        else:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                x_future = executor.submit(_cut_combo_component, dataset, x_variable, coo_index, time)
+                y_future = executor.submit(_cut_combo_component, dataset, y_variable, coo_index, time)
+            x, y = x_future.result(), y_future.result()
 
-        x = _cut_interpret_data(dataset, x_variable, coo_index, time)[0]
-        y = _cut_interpret_data(dataset, y_variable, coo_index, time)[0]
+        # Equations on half precision data are computed in single precision, and the results reduced again
+        if equation_type != 'component' and (x.dtype == np.float16 or y.dtype == np.float16):
+            results = _compute_variable_equation(equation_type, x.astype(np.float32), y.astype(np.float32))
+            return [result.astype(np.float16) for result in results]
 
         return _compute_variable_equation(equation_type, x, y)
 
@@ -1403,60 +2104,126 @@ def _cut_interpret_data(dataset: Dataset, variable: Variable, coo_index: tuple[f
 
         year, month, day, hour = time
 
-        if (year is None) and (month is not None):
-            years = [x for x in get_years(dataset) if month in get_months(dataset, x, variable)]
-            month_datas = list()
+        if (year is None) or (month is None):
+            months = _get_time_months(dataset, variable, time)
+            if len(months) == 0:
+                raise ValueError('No data found for the given time')
 
-            for year in years:
-                variable_data = _load(dataset, year, month, variable)[variable.key]
-                month_datas.append(variable_data[:, coo_index[0]:coo_index[1], coo_index[2]:coo_index[3]])
+            # Size the output from the time information, so that month slices are copied into place once
+            lengths = [len(_load_time_information(dataset, year, month)['day_ts']) for year, month in months]
+            offsets = np.concatenate(([0, ], np.cumsum(lengths)))
 
-            return [np.concatenate(month_datas), ]
+            def get_month_data(year_month: tuple[int, int]) -> np.ndarray:
+                path = _get_path(dataset, *year_month, variable)
 
-        elif year is None:
-            years = get_years(dataset, variable)
-            year_datas = list()
+                # Use the file if it is already loaded. Otherwise, read only the variable, leaving the globals alone
+                with loaded_lock:
+                    file_data = loaded_files.get(path)
+                if file_data is None:
+                    file_data = sio.loadmat(path, squeeze_me=True, variable_names=(variable.key, ))
 
-            for year in years:
-                for month in get_months(dataset, year, variable):
-                    variable_data = _load(dataset, year, month, variable)[variable.key]
-                    year_datas.append(variable_data[:, coo_index[0]:coo_index[1], coo_index[2]:coo_index[3]])
-            return [np.concatenate(year_datas), ]
+                return file_data[variable.key][:, coo_index[0]:coo_index[1], coo_index[2]:coo_index[3]]
 
-        elif month is None:
-            months = get_months(dataset, year, variable)
+            def copy_month_data(month_index: int) -> None:
+                data[offsets[month_index]:offsets[month_index + 1]] = get_month_data(months[month_index])
 
-            month_datas = list()
+            # The first month gives the data type. Reading and copying the others is I/O bound and releases the GIL,
+            # so it is done concurrently. Each worker writes to its own rows
+            first_month_data = get_month_data(months[0])
+            data = np.empty((offsets[-1], ) + first_month_data.shape[1:], dtype=_get_data_dtype(first_month_data.dtype))
+            data[:offsets[1]] = first_month_data
 
-            for month in months:
-                variable_data = _load(dataset, year, month, variable)[variable.key]
-                month_datas.append(variable_data[:, coo_index[0]:coo_index[1], coo_index[2]:coo_index[3]])
-            return [np.concatenate(month_datas), ]
+            if len(months) > 1:
+                with ThreadPoolExecutor(max_workers=min(8, len(months) - 1)) as executor:
+                    list(executor.map(copy_month_data, range(1, len(months))))
+
+            return [data, ]
 
         elif day is None:
             variable_data = _load(dataset, year, month, variable)[variable.key]
-            return [variable_data[:, coo_index[0]:coo_index[1], coo_index[2]:coo_index[3]], ]
+            data = variable_data[:, coo_index[0]:coo_index[1], coo_index[2]:coo_index[3]]
+            # Copy, so that changes to the returned data cannot reach the loaded file
+            return [data.astype(_get_data_dtype(data.dtype), order='C'), ]
 
         elif hour is None:
-            hours = get_hours(dataset, year, month, day)
+            start_time_index, end_time_index = _get_day_bounds(dataset, year, month, day)
+            if start_time_index == end_time_index:
+                raise IndexError('No data found for the given day')
 
             variable_data = _load(dataset, year, month, variable)[variable.key]
-            start_time_index = _get_time_index(dataset, year, month, day, hours[0])
-            end_time_index = _get_time_index(dataset, year, month, day, hours[-1])
-
-            return [variable_data[start_time_index:end_time_index + 1, coo_index[0]:coo_index[1], coo_index[
-                                                                                                      2]:coo_index[
-                                                                                                      3]], ]
+            data = variable_data[start_time_index:end_time_index, coo_index[0]:coo_index[1], coo_index[2]:coo_index[3]]
+            return [data.astype(_get_data_dtype(data.dtype), order='C'), ]
 
         else:
-            variable_data = _load(dataset, year, month, variable)[variable.key]
-            # noinspection PyTypeChecker
-            time_index = _get_time_index(dataset, year, month, day, hour)
-            data = variable_data[time_index, coo_index[0]:coo_index[1], coo_index[2]:coo_index[3]]
+            return [_get_time_slice(dataset, variable, coo_index, time), ]
 
-            # Expand to 3D array
-            data = np.expand_dims(data, axis=0)
-            return [data, ]
+
+def _get_data_dtype(dtype: np.dtype) -> np.dtype:
+    """
+    The data type of gathered data, given the type of the stored data.
+
+    This is half precision for floating point data if info.reduced_precision is set, and the stored type otherwise.
+
+    Args:
+        dtype: The type of the stored data.
+
+    Returns:
+        The type of the gathered data.
+
+    """
+    if info.reduced_precision and np.issubdtype(dtype, np.floating):
+        return np.dtype(np.float16)
+
+    return dtype
+
+
+def _cut_combo_component(dataset: Dataset, variable: Variable, coo_index: tuple[float, float, float, float],
+                         time: TIME_TYPE) -> ArrayLike:
+    """
+    Gathers the data of one component of a combo variable, on a worker thread.
+
+    Marks the thread as a combo component thread, so that any nested combo variables are not given threads of their
+    own.
+
+    Args:
+        dataset: The dataset.
+        variable: The component variable.
+        coo_index: The coordinate limit indices.
+        time: The time.
+
+    Returns:
+        The data.
+
+    """
+    combo_thread_state.is_component = True
+    return _cut_interpret_data(dataset, variable, coo_index, time)[0]
+
+
+def _get_time_slice(dataset: Dataset, variable: Variable, coo_index: tuple[float, float, float, float],
+                    time: TIME_TYPE) -> ArrayLike:
+    """
+    Gathers data for a non-combo variable at a single time, cut to coordinate limits.
+
+    Args:
+        dataset: The dataset.
+        variable: The variable.
+        coo_index: The coordinate limit indices.
+        time: The time, with no element None.
+
+    Returns:
+        The data, as a three-dimensional array with a time axis of length 1.
+
+    """
+    _function_call()
+
+    year, month, day, hour = time
+    variable_data = _load(dataset, year, month, variable)[variable.key]
+    # noinspection PyTypeChecker
+    time_index = _get_time_index(dataset, year, month, day, hour)
+    data = variable_data[time_index, coo_index[0]:coo_index[1], coo_index[2]:coo_index[3]]
+
+    # Copy to a contiguous array of the gathered type and expand to 3D
+    return np.array(data, dtype=_get_data_dtype(data.dtype), order='C')[np.newaxis, ...]
 
 
 # ======================== PLOTTING ====================================================================================
@@ -1727,12 +2494,10 @@ def _maximal_limits(limits: tuple[LIMIT_TYPE, ...]) -> LIMIT_TYPE:
     _function_call()
 
     limit_matrix = np.reshape(limits, (len(limits), 4))
-    lat_min = np.amin(limit_matrix[:, 0])
-    lat_max = np.amax(limit_matrix[:, 1])
-    lon_min = np.amin(limit_matrix[:, 2])
-    lon_max = np.amax(limit_matrix[:, 3])
+    minimums = limit_matrix.min(axis=0)
+    maximums = limit_matrix.max(axis=0)
 
-    return lat_min, lat_max, lon_min, lon_max
+    return minimums[0], maximums[1], minimums[2], maximums[3]
 
 def images_to_video(image_directory: str, fps: int, video_path: str) -> None:
     image_paths = [os.path.join(image_directory, path) for path in os_sorted(os.listdir(image_directory)) if
@@ -1921,26 +2686,17 @@ DataCollection) -> DataCollection:
         raise ValueError('The specific and reference data collections must have the same vector dimensions.')
 
     len_lat, len_lon = spec_data_collection.spread
-    results = np.empty((spec_data_collection.get_vector_dimension(), spec_data_collection.get_time_length(),
+    results = np.zeros((spec_data_collection.get_vector_dimension(), spec_data_collection.get_time_length(),
                         len_lat, len_lon))
 
-    # For each component at each time step of the specific data
+    # For each component of the specific data
     for component, (spec_component, ref_component) in enumerate(zip(spec_data_collection.data,
                                                                     ref_data_collection.data)):
-        for time_idx, (spec_component_time, time_stamp) in enumerate(zip(spec_component,
-                                                                         spec_data_collection.time_stamps)):
-            print(f'Fraction below for component {component} at {time_stamp}')
-
-            # For each point
-            for lat_idx in range(len_lat):
-                for lon_idx in range(len_lon):
-                    # Find the fraction of points from reference data below value
-                    score = spec_component_time[lat_idx, lon_idx]
-                    total = np.searchsorted(ref_component[:, lat_idx, lon_idx], score)
-                    # noinspection PyTypeChecker
-                    results[component, time_idx, lat_idx, lon_idx] = total / non_nan_count.data[component][0,
-                    lat_idx,
-                    lon_idx]
+        print(f'Fraction below for component {component}')
+
+        # Find the fraction of points from reference data below each value, for all times and points at once
+        _tally_below(np.asarray(ref_component), np.asarray(spec_component), results[component])
+        results[component] /= non_nan_count.data[component][0]
 
     title_prefix = f'Fraction of {ref_data_collection} below {spec_data_collection.variable} '
     title_suffix = f' ({spec_data_collection.dataset})'
@@ -1974,11 +2730,8 @@ def fraction_scalar_below_all_sorted_memory(spec_data_collection: DataCollection
             print(f'Tallying ref data from {year=}, {month=} for spec dc timed {spec_data_collection.time}')
 
             # For each coordinate
-            for lat_idx in range(len_lat):
-                for lon_idx in range(len_lon):
-                    sorted_coordinate_data = sorted_month.get_coordinate_index(None, 0, lat_idx, lon_idx)
-                    coordinate_data = spec_data_collection.get_coordinate_index(None, 0, lat_idx, lon_idx)
-                    tally_below[:, lat_idx, lon_idx] += np.searchsorted(sorted_coordinate_data, coordinate_data)
+            _tally_below(np.asarray(sorted_month.get_component(None, 0)),
+                         np.asarray(spec_data_collection.get_component(None, 0)), tally_below)
 
     # Divide tally by non-nan-count for results array
     results = np.divide(tally_below, ref_non_nan_count)
@@ -1993,6 +2746,50 @@ def fraction_scalar_below_all_sorted_memory(spec_data_collection: DataCollection
                           title_prefix, title_suffix, spec_data_collection.time_stamps)
 
 
+def _tally_below(sorted_data: np.ndarray, data: np.ndarray, tally: np.ndarray) -> None:
+    """
+    For each coordinate, adds to the tally the number of sorted values which are below each data value.
+
+    All arrays are three-dimensional, with time as the first axis. The sorted data must be sorted along the time axis.
+    The data and tally must have the same shape. Half precision data, from reduced precision mode, is tallied in single
+    precision, since numba does not compile half precision arithmetic. The cast is exact, so the tally is unchanged.
+
+    Args:
+        sorted_data: The sorted data.
+        data: The data.
+        tally: The tally. Updated in place.
+
+    Returns:
+        None
+
+    """
+    if sorted_data.dtype == np.float16:
+        sorted_data = sorted_data.astype(np.float32)
+    if data.dtype == np.float16:
+        data = data.astype(np.float32)
+
+    _tally_below_kernel(sorted_data, data, tally)
+
+
+@njit(parallel=True, cache=True)
+def _tally_below_kernel(sorted_data: np.ndarray, data: np.ndarray, tally: np.ndarray) -> None:
+    """
+    Compiled implementation of _tally_below. Parallel over latitude, if numba is available.
+
+    Args:
+        sorted_data: The sorted data.
+        data: The data.
+        tally: The tally. Updated in place.
+
+    Returns:
+        None
+
+    """
+    for lat_idx in prange(data.shape[1]):
+        for lon_idx in range(data.shape[2]):
+            tally[:, lat_idx, lon_idx] += np.searchsorted(sorted_data[:, lat_idx, lon_idx], data[:, lat_idx, lon_idx])
+
+
 def max_dc(data_collection: DataCollection, per_time_slice: bool) -> tuple[PointCollection, ArrayLike] | \
                                                                      tuple[PointCollection, TIME_TYPE,
                                                                      ArrayLike]: